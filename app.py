@@ -21,9 +21,12 @@ except Exception:
     pass
 
 # --- Import Data & UI ---
-from utils.gsheet import get_summary_stats
+from utils.gsheet import get_summary_stats, start_warmup
 from utils.ui import load_css, inject_scanline_effect, render_sidebar
 
+# --- Background Warmup (opt-in, once per process) ---
+start_warmup()
+
 # --- Load Custom CSS & Effects ---
 load_css()
 inject_scanline_effect()
@@ -1,6 +1,5 @@
 
 import streamlit as st
-import requests
 import uuid
 import threading
 
@@ -15,6 +14,7 @@ def get_client_id():
 def _send_event_async(url: str, payload: dict) -> None:
     """Fire-and-forget HTTP POST to GA4 (runs in background thread)."""
     try:
+        import requests  # deferred: keeps it off the page's critical path
         requests.post(url, json=payload, timeout=3)
     except Exception:
         pass
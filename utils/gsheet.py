@@ -1,12 +1,19 @@
 """
 Google Sheets Connection Module for VMR Dashboard
 讀取 Google Sheets 股價資料
+
+gspread / google-auth / pandas 皆延遲到實際取資料時才 import，
+首頁只用到 get_summary_stats()，不需要為此付出冷啟動成本。
 """
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, List, Optional
+
 import streamlit as st
-import gspread
-import pandas as pd
-from google.oauth2.service_account import Credentials
-from typing import List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def _get_spreadsheet_id() -> str:
@@ -17,6 +24,9 @@ def _get_spreadsheet_id() -> str:
 @st.cache_resource
 def get_gsheet_client():
     """取得 Google Sheets 客戶端 (使用 secrets.toml)"""
+    import gspread
+    from google.oauth2.service_account import Credentials
+
     try:
         service_account_info = dict(st.secrets["gcp_service_account"])
         scopes = [
@@ -33,6 +43,8 @@ def get_gsheet_client():
 @st.cache_data(ttl=3600)  # 快取 1 小時 (資料為 daily refresh)
 def get_all_data() -> pd.DataFrame:
     """取得所有股價資料"""
+    import pandas as pd
+
     client = get_gsheet_client()
     if not client:
         return pd.DataFrame()
@@ -85,6 +97,8 @@ def get_ticker_list_by_exchange(exchange: str) -> List[str]:
 @st.cache_data(ttl=3600)
 def get_stock_data(ticker: str) -> pd.DataFrame:
     """取得單一股票資料"""
+    import pandas as pd
+
     df = get_all_data()
     if df.empty or 'TICKER' not in df.columns:
         return pd.DataFrame()
@@ -112,6 +126,8 @@ def get_stock_info(ticker: str) -> dict:
     取得個股基本資訊 (Score Cards 用)
     從 get_all_data() 中過濾出該個股的資料並提取資訊
     """
+    import pandas as pd
+
     df = get_all_data()
     
     # 預設值 (Mock Data placeholder for calculated indicators)
@@ -163,3 +179,36 @@ def get_stock_info(ticker: str) -> dict:
     
     return info
 
+
+def _warmup_enabled() -> bool:
+    """Warmup 為 opt-in：secrets.toml 中 [gsheet] warmup = true 才啟用。"""
+    try:
+        return bool(st.secrets.get("gsheet", {}).get("warmup", False))
+    except Exception:
+        return False
+
+
+def _prefetch() -> None:
+    """預先載入資料集與交易所 ticker 索引 (背景執行緒)。"""
+    try:
+        get_all_data()
+        for exchange in ("twse", "tpex"):
+            get_ticker_list_by_exchange(exchange)
+    except Exception:
+        pass
+
+
+@st.cache_resource
+def start_warmup() -> Optional[threading.Thread]:
+    """
+    伺服器啟動後第一次 rerun 時，在背景預熱 get_all_data() 與 ticker 索引。
+    cache_resource 確保每個 process 只觸發一次，不會阻塞首頁渲染。
+
+    Returns:
+        Optional[threading.Thread]: 預熱執行緒；未啟用時回傳 None
+    """
+    if not _warmup_enabled():
+        return None
+    thread = threading.Thread(target=_prefetch, name="gsheet-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -3,6 +3,31 @@ from pathlib import Path
 import subprocess
 
 
+@st.cache_resource
+def _read_css(file_name):
+    """Read a CSS file once per process; returns None if it does not exist."""
+    # Use absolute path based on this file's location to avoid CWD issues
+    css_path = Path(__file__).parent.parent / file_name
+    if not css_path.exists():
+        return None
+    with open(css_path) as f:
+        return f.read()
+
+
+@st.cache_resource
+def get_version_stamp():
+    """Resolve the git version stamp once per process (not on every rerun)."""
+    try:
+        result = subprocess.run(
+            ["git", "log", "-1", "--format=%h | %cd", "--date=short"],
+            capture_output=True, text=True, timeout=3,
+            cwd=Path(__file__).parent.parent
+        )
+        return result.stdout.strip() or "version unknown"
+    except Exception:
+        return "version unknown"
+
+
 def load_css(file_name="assets/style.css"):
     """
     Load an external CSS file and inject it into the Streamlit app.
@@ -10,12 +35,9 @@ def load_css(file_name="assets/style.css"):
     Args:
         file_name (str): Relative path to the CSS file (e.g., "assets/style.css")
     """
-    # Use absolute path based on this file's location to avoid CWD issues
-    css_path = Path(__file__).parent.parent / file_name
-    
-    if css_path.exists():
-        with open(css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    css = _read_css(file_name)
+    if css is not None:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
     else:
         st.warning(f"CSS file not found: {file_name}")
 
@@ -45,12 +67,5 @@ def render_sidebar():
 
         # --- Version ---
         st.markdown("---")
-        try:
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%h | %cd", "--date=short"],
-                capture_output=True, text=True, timeout=3
-            )
-            st.caption(f"🔖 {result.stdout.strip()}")
-        except Exception:
-            st.caption("🔖 version unknown")
+        st.caption(f"🔖 {get_version_stamp()}")
 